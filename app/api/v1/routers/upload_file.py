@@ -2,7 +2,7 @@ from fastapi import APIRouter, Request, UploadFile, File
 from fastapi.responses import JSONResponse
 from typing import Annotated
 
-from app.infrastructure.storage import MediaManger
+from app.infrastructure.storage import MediaManager
 from app.core import limiter, settings, logger
 from app.infrastructure.db.crud import *
 from app.api.deps import CurrentUserDep
@@ -33,7 +33,7 @@ async def upload_avatar(
         raise FileExtensionNotAllowed()
 
     try:
-        async with MediaManger() as media_manager:
+        async with MediaManager() as media_manager:
             # Save new avatar
             avatar_path = await media_manager.save_avatar(avatar)  # type: ignore
 
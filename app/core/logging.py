@@ -37,11 +37,14 @@ def setup_logging(file_name: str = "") -> None:
     """
     logger.remove()
 
+    # Sinks are enqueued, so writing, rotating and compressing logs happens in a
+    # background thread instead of blocking the event loop of the caller
     logger.add(
         sys.stderr,
         level="INFO",
         format="<green>{time:DD:MM:YYYY HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         colorize=True,
+        enqueue=True,
     )
 
     logger.add(
@@ -51,6 +54,7 @@ def setup_logging(file_name: str = "") -> None:
         compression="zip",
         level="INFO",
         format="{time:DD:MM:YYYY HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        enqueue=True,
     )
 
     setup_fastapi_logging()
@@ -30,4 +30,33 @@ class CreateOperations:
                 return True
             except Exception as e:
                 logger.error(f"Failed to create titles: {e}")
-                return False
\ No newline at end of file
+                return False
+
+    @staticmethod
+    async def bulk_upsert(titles: list[Title]) -> bool:
+        """Insert or update multiple titles in the database with a single statement."""
+        if not titles:
+            return True
+
+        # A row can't be updated twice by one statement, the last duplicate wins
+        unique_titles = {title.id: title for title in titles}
+
+        async with get_session() as session:
+            try:
+                stmt = insert(Title).values(
+                    [title.model_dump() for title in unique_titles.values()]
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Title.id],
+                    set_={
+                        column.name: stmt.excluded[column.name]
+                        for column in Title.__table__.columns  # type: ignore
+                        if column.name not in ("id", "created_at")
+                    },
+                )
+                await session.exec(stmt)  # type: ignore
+                await session.commit()
+                return True
+            except Exception as e:
+                logger.error(f"Failed to upsert titles: {e}")
+                return False
@@ -20,9 +20,23 @@ class ReadOperations:
             try:
                 result = await session.exec(select(Title).where(Title.id == id))
                 return result.first()
-            except:
+            except Exception:
                 return None
 
+    @staticmethod
+    async def by_ids(ids: list[str]) -> list[Title]:
+        """Fetch the titles with the given IDs using a single query, missing IDs are skipped."""
+        if not ids:
+            return []
+
+        async with get_session() as session:
+            try:
+                result = await session.exec(select(Title).where(Title.id.in_(ids)))  # type: ignore
+                return list(result.all())
+            except Exception as e:
+                logger.error(f"Failed to fetch titles by IDs: {e}")
+                return []
+
     @staticmethod
     async def for_update(time_ago: timedelta) -> list[str]:
         """Fetch all titles that need to be updated."""
@@ -1,3 +1,6 @@
+from sqlalchemy import update
+from typing import Any
+
 from ...session import get_session
 from ...models import Title
 
@@ -7,21 +10,40 @@ from app.core import logger
 class UpdateOperations:
     @staticmethod
     async def fields(title_id: str, **fields) -> bool:
-        """Update fields of an existing title in the database."""
+        """
+        Update fields of an existing title in the database.
+
+        All fields are set by a single UPDATE statement, without loading the title first.
+        """
         if not fields:
             raise ValueError("No fields provided for update")
 
         async with get_session() as session:
             try:
-                title = await session.get(Title, title_id)
-                if not title:
-                    return False
+                stmt = update(Title).where(Title.id == title_id).values(**fields)  # type: ignore
+                result = await session.exec(stmt)  # type: ignore
+                await session.commit()
+                return result.rowcount > 0
+            except Exception as e:
+                logger.error(f"Failed to update title: {e}")
+                return False
 
-                for key, value in fields.items():
-                    setattr(title, key, value)
+    @staticmethod
+    async def bulk_fields(rows: list[dict[str, Any]]) -> bool:
+        """
+        Update fields of multiple existing titles in the database.
+
+        Each row holds the title "id" and the fields to set. All rows are sent as
+        one executemany UPDATE by primary key.
+        """
+        if not rows:
+            return True
 
+        async with get_session() as session:
+            try:
+                await session.exec(update(Title), params=rows)  # type: ignore
                 await session.commit()
                 return True
             except Exception as e:
-                logger.error(f"Failed to update title: {e}")
+                logger.error(f"Failed to update titles: {e}")
                 return False
@@ -10,11 +10,15 @@ from typing import Annotated
 
 from app.core import settings
 
+# Connections kept open by the pool, and how many more it opens under load
+POOL_SIZE = 20
+POOL_MAX_OVERFLOW = 30
+
 engine = create_async_engine(
     str(settings.SQLALCHEMY_DATABASE_URI),
     connect_args={"server_settings": {"timezone": "UTC"}},
-    pool_size=20,
-    max_overflow=30,
+    pool_size=POOL_SIZE,
+    max_overflow=POOL_MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_recycle=3600,
     poolclass=AsyncAdaptedQueuePool,
@@ -80,6 +80,51 @@ class TaskManager:
             rows = await cursor.fetchall()
             return [row[0] for row in rows]
 
+    async def get_missing_pages(
+        self,
+        provider: SourceProvider,
+        last_page: int,
+        min_age: timedelta = timedelta(days=2),
+    ) -> list[int]:
+        """
+        Get pages in 1..last_page that weren't completed within the time frame.
+
+        The page range is generated and diffed against parsed_pages inside SQLite,
+        so only the missing pages are materialized in Python. They are fetched at once,
+        a cursor left open while the caller waits on a full queue would hold a read
+        lock that blocks mark_page_completed.
+        """
+        cutoff_date = datetime.now() - min_age
+
+        # Cleanup old records before fetching missing pages
+        await self.cleanup_old_records(min_age)
+
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                """
+                WITH RECURSIVE pages(page_number) AS (
+                    SELECT 1 WHERE ? >= 1
+                    UNION ALL
+                    SELECT page_number + 1 FROM pages WHERE page_number < ?
+                )
+                SELECT page_number FROM pages
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM parsed_pages
+                    WHERE parsed_pages.provider = ?
+                    AND parsed_pages.page_number = pages.page_number
+                    AND datetime(parsed_pages.parsed_at) > datetime(?)
+                )
+                """,
+                (
+                    last_page,
+                    last_page,
+                    provider.name,
+                    cutoff_date.strftime("%Y-%m-%d %H:%M:%S"),
+                ),
+            ) as cursor:
+                rows = await cursor.fetchall()
+                return [row[0] for row in rows]
+
     async def cleanup_old_records(
         self,
         min_age: timedelta = timedelta(days=2),
@@ -40,9 +40,10 @@ class ApiKeyManager(BaseValueManager):
             async with aiofiles.open(self._api_keys_file, "w"): ...
             return []
         
+        keys: dict[str, None] = {}  # ordered dedupe
         async with aiofiles.open(self._api_keys_file, mode='r') as f:
-            content = await f.read()
+            async for line in f:
+                if key := line.strip():
+                    keys[key] = None
 
-        keys = [line for i in content.splitlines() if (line := i.strip())]
-
-        return list(set(keys))
+        return list(keys)
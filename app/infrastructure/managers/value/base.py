@@ -1,12 +1,14 @@
 from dataclasses import dataclass, field
+from collections import OrderedDict
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 from datetime import datetime
 from pathlib import Path
-from typing import Any
 from enum import Enum
 import aiosqlite
-import aiofiles
 import asyncio
+import json
+import math
 import time
 
 from app.core import logger, settings
@@ -19,6 +21,138 @@ class ValueStatus(Enum):
     COOLING = "cooling"
 
 
+# Plain status strings for SQL parameters, avoids the enum lookup per query
+_ACTIVE = ValueStatus.ACTIVE.value
+_COOLING = ValueStatus.COOLING.value
+
+# Connection tuning applied to every SQLite connection.
+# journal_mode is persisted in the database file, the rest are per-connection.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA busy_timeout=60000",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+# How many least-used values get_value checks against the rate limits per call
+PICKUP_CANDIDATES = 32
+
+# Upper bound for in-memory usage tracking, least recently used values are evicted
+MAX_TRACKED_VALUES = 10_000
+
+# How many validation results to accumulate before writing them in one transaction
+VALIDATION_FLUSH_SIZE = 500
+
+# Scheduled validation is spread over this many ticks per validation interval,
+# each tick checks at most this fraction of the values, longest unchecked first
+VALIDATION_SLICES = 12
+
+# SQL statements are kept as constant strings, so SQLite's statement cache can
+# reuse the prepared program instead of parsing and planning it on every call.
+SQL_CREATE_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS value_manager (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        value TEXT UNIQUE NOT NULL,
+        status TEXT NOT NULL DEFAULT '{_ACTIVE}',
+        last_used TIMESTAMP,
+        cooldown_until TIMESTAMP,
+        usage_count INTEGER DEFAULT 0,
+        usage_windows BLOB,
+        checked_at TIMESTAMP
+    )
+"""
+SQL_TABLE_INFO = "PRAGMA table_info(value_manager)"
+SQL_ADD_USAGE_WINDOWS = "ALTER TABLE value_manager ADD COLUMN usage_windows BLOB"
+SQL_ADD_CHECKED_AT = "ALTER TABLE value_manager ADD COLUMN checked_at TIMESTAMP"
+SQL_CREATE_PICKUP_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_value_manager_pickup
+    ON value_manager(status, usage_count, last_used)
+"""
+SQL_DROP_STATUS_INDEX = "DROP INDEX IF EXISTS idx_value_manager_status"
+SQL_CREATE_COOLDOWN_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_value_manager_status_cooldown
+    ON value_manager(status, cooldown_until)
+"""
+SQL_CREATE_CHECKED_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_value_manager_checked
+    ON value_manager(checked_at)
+"""
+SQL_ANALYZE = "ANALYZE value_manager"
+
+SQL_LOAD_USAGE_WINDOWS = """
+    SELECT value, usage_windows FROM value_manager
+    WHERE usage_windows IS NOT NULL
+    ORDER BY last_used DESC
+    LIMIT ?
+"""
+SQL_CLEAR_USAGE_WINDOWS = (
+    "UPDATE value_manager SET usage_windows = NULL WHERE usage_windows IS NOT NULL"
+)
+SQL_SAVE_USAGE_WINDOWS = "UPDATE value_manager SET usage_windows = ? WHERE value = ?"
+
+# Each branch is answered in pickup index order, an OR of both would make SQLite
+# sort every available value. Only the few rows of the two branches are merged.
+SQL_GET_NEXT = """
+    SELECT value, usage_count, last_used FROM (
+        SELECT value, usage_count, last_used FROM value_manager
+        WHERE status = ?
+        ORDER BY usage_count ASC, last_used ASC
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT value, usage_count, last_used FROM (
+        SELECT value, usage_count, last_used FROM value_manager
+        WHERE status = ? AND cooldown_until <= ?
+        ORDER BY usage_count ASC, last_used ASC
+        LIMIT ?
+    )
+    ORDER BY usage_count ASC, last_used ASC
+    LIMIT ?
+"""
+SQL_MARK_USED = """
+    UPDATE value_manager
+    SET last_used = CURRENT_TIMESTAMP,
+        usage_count = usage_count + 1,
+        status = ?,
+        cooldown_until = ?
+    WHERE value = ?
+"""
+SQL_HAS_EXPIRED_COOLDOWN = (
+    "SELECT 1 FROM value_manager WHERE status = ? AND cooldown_until <= ? LIMIT 1"
+)
+SQL_RESET_EXPIRED_COOLDOWN = """
+    UPDATE value_manager
+    SET status = ?
+    WHERE status = ?
+    AND cooldown_until <= ?
+"""
+SQL_INSERT_VALUE = "INSERT OR IGNORE INTO value_manager (value, status) VALUES (?, ?)"
+SQL_DELETE_VALUE = "DELETE FROM value_manager WHERE value = ?"
+# Values are bound as one JSON array, so the statement text doesn't depend on the batch size
+SQL_DELETE_VALUES = (
+    "DELETE FROM value_manager WHERE value IN (SELECT value FROM json_each(?))"
+)
+SQL_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM value_manager GROUP BY status"
+SQL_ITER_VALUES = "SELECT id, value FROM value_manager WHERE id > ? ORDER BY id LIMIT ?"
+SQL_ITER_UNCHECKED_VALUES = """
+    SELECT id, value FROM value_manager
+    WHERE id > ?
+    AND (checked_at IS NULL OR checked_at <= ?)
+    ORDER BY id
+    LIMIT ?
+"""
+# Never checked values sort first
+SQL_SELECT_VALIDATION_SLICE = """
+    SELECT id, value FROM value_manager
+    WHERE checked_at IS NULL OR checked_at <= ?
+    ORDER BY checked_at
+    LIMIT ?
+"""
+SQL_MARK_CHECKED = "UPDATE value_manager SET checked_at = ? WHERE value = ?"
+
+
 @dataclass
 class Limit:
     """Represents a rate limit configuration"""
@@ -28,13 +162,27 @@ class Limit:
     time_window: int  # seconds
     cooldown: int  # seconds
 
+    @property
+    def refill_rate(self) -> float:
+        """Requests regained per second"""
+        return self.max_requests / self.time_window
 
-@dataclass
-class UsageRecord:
-    """Tracks usage for a specific limit"""
 
-    timestamps: list[float] = field(default_factory=list)
-    last_reset: float = field(default_factory=time.time)
+@dataclass(slots=True)
+class TokenBucket:
+    """Tracks usage for a specific limit as a token bucket"""
+
+    tokens: float
+    updated_at: float = field(default_factory=time.time)
+
+    def refill(self, limit: Limit, now: float) -> float:
+        """Add the tokens regained since the last update and return the current amount"""
+        self.tokens = min(
+            limit.max_requests,
+            self.tokens + (now - self.updated_at) * limit.refill_rate,
+        )
+        self.updated_at = now
+        return self.tokens
 
 
 class BaseValueManager(ABC):
@@ -56,6 +204,7 @@ class BaseValueManager(ABC):
         fetch_interval: int | None = None,
         batch_validation: bool = False,
         batch_size: int = 10,
+        max_concurrent_validations: int = 128,
     ) -> None:
         """
         Initialize the base value manager.
@@ -66,11 +215,13 @@ class BaseValueManager(ABC):
             fetch_interval: Interval in seconds for fetching new data (None to disable)
             batch_validation: Whether to use batch processing for validation
             batch_size: Size of batches for batch processing
+            max_concurrent_validations: Maximum number of validations running at once in batch mode
         """
         self.validation_interval = validation_interval
         self.fetch_interval = fetch_interval
         self.batch_validation = batch_validation
         self.batch_size = batch_size
+        self.max_concurrent_validations = max_concurrent_validations
 
         # Get DB name from class name and set up database path
         self._db_name = self.__class__.__name__.lower()
@@ -79,7 +230,12 @@ class BaseValueManager(ABC):
 
         # Rate limiting configuration
         self.limits: dict[str, Limit] = {}
-        self.usage_tracking: dict[str, dict[str, UsageRecord]] = {}
+        self._limits_tuple: tuple[Limit, ...] = ()
+        self.usage_tracking: OrderedDict[str, dict[str, TokenBucket]] = OrderedDict()
+
+        # Long-lived database connection, writes are serialized through the lock
+        self._db: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
 
         # Background tasks
         self._validation_task: asyncio.Task | None = None
@@ -88,7 +244,9 @@ class BaseValueManager(ABC):
 
     async def initialize(self) -> None:
         """Initialize the manager and start background tasks"""
+        self._db = await self._connect()
         await self._init_database()
+        await self._load_usage_tracking()
         self._running = True
 
         # Start background tasks
@@ -118,6 +276,11 @@ class BaseValueManager(ABC):
             except asyncio.CancelledError:
                 pass
 
+        if self._db:
+            await self._save_usage_tracking()
+            await self._db.close()
+            self._db = None
+
         logger.info(f"{self.__class__.__name__} cleaned up")
 
     def add_limit(
@@ -133,63 +296,164 @@ class BaseValueManager(ABC):
             cooldown: Cooldown period in seconds after limit is reached
         """
         self.limits[name] = Limit(name, max_requests, time_window, cooldown)
+        self._limits_tuple = tuple(self.limits.values())
         logger.info(
             f"{self.__class__.__name__}: Added limit '{name}': {max_requests} requests per {time_window}s, cooldown {cooldown}s"
         )
 
+    @staticmethod
+    async def _configure(db: aiosqlite.Connection) -> None:
+        """Apply performance PRAGMAs to an open connection"""
+        for pragma in SQLITE_PRAGMAS:
+            await db.execute(pragma)
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a configured connection to the manager database"""
+        db = await aiosqlite.connect(self._db_path)
+        await self._configure(db)
+        return db
+
+    @property
+    def _connection(self) -> aiosqlite.Connection:
+        """Shared database connection opened in `initialize`"""
+        if self._db is None:
+            raise RuntimeError(f"{self.__class__.__name__} is not initialized")
+        return self._db
+
     async def _init_database(self) -> None:
         """Initialize database table for this manager"""
-        if not self._db_path.exists():
-            async with aiofiles.open(self._db_path, mode="w"): ...
-            
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS value_manager (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    value TEXT UNIQUE NOT NULL,
-                    status TEXT NOT NULL DEFAULT '{ValueStatus.ACTIVE.value}',
-                    last_used TIMESTAMP,
-                    cooldown_until TIMESTAMP,
-                    usage_count INTEGER DEFAULT 0
-                )
-                """
-            )
+        db = self._connection
+        async with self._write_lock:
+            await db.execute(SQL_CREATE_TABLE)
+
+            # Databases created by older versions
+            cursor = await db.execute(SQL_TABLE_INFO)
+            columns = {row[1] for row in await cursor.fetchall()}
+            if "usage_windows" not in columns:
+                await db.execute(SQL_ADD_USAGE_WINDOWS)
+            if "checked_at" not in columns:
+                await db.execute(SQL_ADD_CHECKED_AT)
+
+            # Both branches of SQL_GET_NEXT read their candidates in this index's order
+            await db.execute(SQL_CREATE_PICKUP_INDEX)
+            # Superseded by idx_value_manager_pickup
+            await db.execute(SQL_DROP_STATUS_INDEX)
+            await db.execute(SQL_CREATE_COOLDOWN_INDEX)
+            # Lets a validation slice read the longest unchecked values in index order
+            await db.execute(SQL_CREATE_CHECKED_INDEX)
+            await db.execute(SQL_ANALYZE)
 
-            await db.execute(
-                f"""
-                CREATE INDEX IF NOT EXISTS idx_value_manager_status 
-                ON value_manager(status)
-                """
-            )
-            await db.execute(
-                f"""
-                CREATE INDEX IF NOT EXISTS idx_value_manager_status_cooldown 
-                ON value_manager(status, cooldown_until)
-                """
-            )
+            await db.commit()
+
+    async def _load_usage_tracking(self) -> None:
+        """Restore rate limit buckets persisted by a previous run"""
+        if not self._limits_tuple:
+            return
 
+        db = self._connection
+        cursor = await db.execute(SQL_LOAD_USAGE_WINDOWS, (MAX_TRACKED_VALUES,))
+        rows = await cursor.fetchall()
+        current_time = time.time()
+
+        # Oldest first, so the most recently used values end up last in the LRU order
+        for value, packed in reversed(rows):
+            try:
+                saved: dict[str, list[float]] = json.loads(packed)
+            except ValueError:
+                continue  # Written by an older version
+
+            records = {}
+            for limit in self._limits_tuple:
+                if limit.name not in saved:
+                    continue
+
+                bucket = TokenBucket(*saved[limit.name])
+                # A full bucket behaves exactly like an untracked value
+                if bucket.refill(limit, current_time) < limit.max_requests:
+                    records[limit.name] = bucket
+
+            if records:
+                self.usage_tracking[value] = records
+
+        logger.info(
+            f"{self.__class__.__name__}: Restored usage tracking for {len(self.usage_tracking)} values"
+        )
+
+    async def _save_usage_tracking(self) -> None:
+        """Persist rate limit buckets so a restart doesn't reset them"""
+        rows = [
+            (
+                json.dumps(
+                    {
+                        name: [bucket.tokens, bucket.updated_at]
+                        for name, bucket in records.items()
+                    }
+                ),
+                value,
+            )
+            for value, records in self.usage_tracking.items()
+            if records
+        ]
+
+        db = self._connection
+        async with self._write_lock:
+            await db.execute(SQL_CLEAR_USAGE_WINDOWS)
+            await db.executemany(SQL_SAVE_USAGE_WINDOWS, rows)
             await db.commit()
 
+    @staticmethod
+    async def _wait_next_run(next_run: float, interval: float) -> float:
+        """
+        Sleep until the scheduled run and return the time of the one after it.
+
+        Runs are scheduled on a fixed monotonic grid, so time spent working doesn't
+        push later runs back. Runs missed because work overran are skipped.
+        """
+        now = time.monotonic()
+        while next_run < now:
+            next_run += interval
+
+        await asyncio.sleep(next_run - now)
+        return next_run + interval
+
     async def _validation_scheduler(self) -> None:
-        """Background task for periodic validation"""
+        """
+        Background task for periodic validation.
+
+        Ticks VALIDATION_SLICES times per validation interval and validates at most
+        one slice of the values on each tick, the ones unchecked for longest.
+        Each value is still validated about once per interval, while the work
+        of a tick stays bounded even when many values come due together.
+        """
+        max_age: int = self.validation_interval  # type: ignore
+        interval = max_age / VALIDATION_SLICES
+        next_run = time.monotonic() + interval
+
         while self._running:
             try:
-                await asyncio.sleep(self.validation_interval)  # type: ignore
+                next_run = await self._wait_next_run(next_run, interval)
                 if self._running:
                     logger.info("Running scheduled validation...")
-                    await self.validate_values()
+                    await self._update_cooling_statuses()
+                    stats = await self.get_stats()
+                    await self.validate_values(
+                        max_age=max_age,
+                        limit=math.ceil(stats["total_values"] / VALIDATION_SLICES),
+                    )
+                    await self._save_usage_tracking()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in validation scheduler: {e}")
-                await asyncio.sleep(min(60, self.validation_interval))  # type: ignore
 
     async def _fetch_scheduler(self) -> None:
         """Background task for periodic data fetching"""
+        interval: int = self.fetch_interval  # type: ignore
+        next_run = time.monotonic() + interval
+
         while self._running:
             try:
-                await asyncio.sleep(self.fetch_interval)  # type: ignore
+                next_run = await self._wait_next_run(next_run, interval)
                 if self._running:
                     logger.info("Running scheduled data fetch...")
                     await self.fetch_and_store_values()
@@ -208,29 +472,40 @@ class BaseValueManager(ABC):
         Returns:
             Available value string or None if no values are available
         """
-        # First, update cooling statuses
-        await self._update_cooling_statuses()
-
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute(
-                f"""
-                SELECT value FROM value_manager 
-                WHERE status = '{ValueStatus.ACTIVE.value}'
-                ORDER BY usage_count ASC, last_used ASC
-                LIMIT 1
-                """
-            )
-
-            rows = await cursor.fetchall()
-
-            for row in rows:
-                value = row[0]
-                if await self._can_use_value(value):
-                    # Auto mark as used if requested
-                    if auto_mark_as_used:
-                        await self.mark_as_used(value)
+        if not auto_mark_as_used:
+            return await self._pick_value()
+
+        # Picking and marking happen under the write lock, so concurrent callers never
+        # receive the same value for the same slot. Usage, status and cooldown are
+        # written by one statement, also when the pick exhausts a limit.
+        async with self._write_lock:
+            value = await self._pick_value()
+            if value is None:
+                return None
+            await self._mark_used(value)
+
+        return value
+
+    async def _pick_value(self) -> str | None:
+        """Get the least used available value that isn't over its rate limits, without marking it"""
+        # Values whose cooldown has expired are picked up directly, their status
+        # is reset once used and periodically by the validation scheduler
+        db = self._connection
+        cursor = await db.execute(
+            SQL_GET_NEXT,
+            (
+                _ACTIVE,
+                PICKUP_CANDIDATES,
+                _COOLING,
+                datetime.now(),
+                PICKUP_CANDIDATES,
+                PICKUP_CANDIDATES,
+            ),
+        )
 
-                    return value
+        for row in await cursor.fetchall():
+            if self._can_use_value(row[0]):
+                return row[0]
 
         return None
 
@@ -244,103 +519,98 @@ class BaseValueManager(ABC):
         Returns:
             True if marking was successful, False otherwise
         """
-        current_time = time.time()
-
-        # Initialize usage tracking for this value if not exists
-        if value not in self.usage_tracking:
-            self.usage_tracking[value] = {}
+        async with self._write_lock:
+            await self._mark_used(value)
 
-        # Update usage for each limit
-        needs_cooling = False
-        cooldown_until = 0
-
-        for limit_name, limit in self.limits.items():
-            if limit_name not in self.usage_tracking[value]:
-                self.usage_tracking[value][limit_name] = UsageRecord()
-
-            usage_record = self.usage_tracking[value][limit_name]
-
-            # Clean old timestamps outside the time window
-            cutoff_time = current_time - limit.time_window
-            usage_record.timestamps = [
-                ts for ts in usage_record.timestamps if ts > cutoff_time
-            ]
-
-            # Add current usage
-            usage_record.timestamps.append(current_time)
+        return True
 
-            # Check if limit is exceeded
-            if len(usage_record.timestamps) >= limit.max_requests:
-                needs_cooling = True
-                limit_cooldown_until = current_time + limit.cooldown
-                cooldown_until = max(cooldown_until, limit_cooldown_until)
+    async def _mark_used(self, value: str) -> None:
+        """Record a usage of the value, sending it to cooling if a limit is exhausted. Needs the write lock."""
+        cooldown_until = self._track_usage(value)
 
         # Update database
-        status = (
-            ValueStatus.COOLING.value if needs_cooling else ValueStatus.ACTIVE.value
-        )
+        status = _COOLING if cooldown_until else _ACTIVE
         cooldown_timestamp = (
-            datetime.fromtimestamp(cooldown_until) if needs_cooling else None
+            datetime.fromtimestamp(cooldown_until) if cooldown_until else None
         )
 
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                f"""
-                UPDATE value_manager
-                SET last_used = CURRENT_TIMESTAMP, 
-                    usage_count = usage_count + 1,
-                    status = ?,
-                    cooldown_until = ?
-                WHERE value = ?
-                """,
-                (status, cooldown_timestamp, value),
-            )
-            await db.commit()
+        db = self._connection
+        await db.execute(SQL_MARK_USED, (status, cooldown_timestamp, value))
+        await db.commit()
 
-        if needs_cooling:
+        if cooldown_until:
             logger.debug(
                 f"Value {value} sent to cooling until {datetime.fromtimestamp(cooldown_until)}"
             )
 
-        return True
+    def _track_usage(self, value: str) -> float | None:
+        """
+        Record a usage of the value against every configured limit.
 
-    async def _can_use_value(self, value: str) -> bool:
-        """Check if a value can be used based on rate limits"""
-        if value not in self.usage_tracking:
-            return True
+        Returns:
+            Timestamp until which the value has to cool down, or None if no limit is exceeded
+        """
+        if not self._limits_tuple:
+            return None
 
         current_time = time.time()
 
-        for limit_name, limit in self.limits.items():
-            if limit_name not in self.usage_tracking[value]:
-                continue
+        # Initialize usage tracking for this value if not exists
+        records = self.usage_tracking.get(value)
+        if records is None:
+            records = self.usage_tracking[value] = {}
+            if len(self.usage_tracking) > MAX_TRACKED_VALUES:
+                self.usage_tracking.popitem(last=False)
+        else:
+            self.usage_tracking.move_to_end(value)
 
-            usage_record = self.usage_tracking[value][limit_name]
+        # Update usage for each limit
+        cooldown_until = None
+
+        for limit in self._limits_tuple:
+            bucket = records.get(limit.name)
+            if bucket is None:
+                bucket = records[limit.name] = TokenBucket(
+                    limit.max_requests, current_time
+                )
+
+            # Take a token for the current usage
+            bucket.tokens = bucket.refill(limit, current_time) - 1
+
+            # Check if limit is exceeded
+            if bucket.tokens < 1:
+                limit_cooldown_until = current_time + limit.cooldown
+                cooldown_until = max(cooldown_until or 0, limit_cooldown_until)
 
-            # Clean old timestamps
-            cutoff_time = current_time - limit.time_window
-            usage_record.timestamps = [
-                ts for ts in usage_record.timestamps if ts > cutoff_time
-            ]
+        return cooldown_until
 
-            # Check if adding one more request would exceed the limit
-            if len(usage_record.timestamps) >= limit.max_requests:
+    def _can_use_value(self, value: str) -> bool:
+        """Check if a value can be used based on rate limits"""
+        records = self.usage_tracking.get(value)
+        if not records or not self._limits_tuple:
+            return True
+
+        current_time = time.time()
+
+        for limit in self._limits_tuple:
+            bucket = records.get(limit.name)
+            if bucket is not None and bucket.refill(limit, current_time) < 1:
                 return False
 
         return True
 
     async def _update_cooling_statuses(self) -> None:
         """Update status of values that finished cooling down"""
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                f"""
-                UPDATE value_manager
-                SET status = '{ValueStatus.ACTIVE.value}' 
-                WHERE status = '{ValueStatus.COOLING.value}' 
-                AND cooldown_until <= ?
-                """,
-                (datetime.now(),),
-            )
+        db = self._connection
+        now = datetime.now()
+
+        # Cheap read probe first, so a no-op doesn't open a write transaction
+        cursor = await db.execute(SQL_HAS_EXPIRED_COOLDOWN, (_COOLING, now))
+        if not await cursor.fetchone():
+            return
+
+        async with self._write_lock:
+            await db.execute(SQL_RESET_EXPIRED_COOLDOWN, (_ACTIVE, _COOLING, now))
             await db.commit()
 
     async def store_values(self, values: list[str]) -> None:
@@ -350,32 +620,31 @@ class BaseValueManager(ABC):
         Args:
             values: List of values to store
         """
+        # Drop empty values and duplicates before they reach SQLite, keeping source order
+        values = list(dict.fromkeys(value for value in values if value))
         if not values:
             return
 
-        stored_count = 0
-        async with aiosqlite.connect(self._db_path) as db:
-            for value in values:
-                try:
-                    await db.execute(
-                        f"""
-                        INSERT INTO value_manager (value, status) 
-                        VALUES (?, '{ValueStatus.ACTIVE.value}')
-                        """,
-                        (value,),
-                    )
-                    stored_count += 1
-                except aiosqlite.IntegrityError:
-                    continue
+        db = self._connection
+        async with self._write_lock:
+            changes_before = db.total_changes
 
+            # One transaction for the whole batch, duplicates are skipped by SQLite
+            await db.executemany(
+                SQL_INSERT_VALUE,
+                [(value, _ACTIVE) for value in values],
+            )
             await db.commit()
 
+            stored_count = db.total_changes - changes_before
+
         logger.info(f"Stored {stored_count} new values")
 
     async def remove_value(self, value: str) -> None:
         """Remove a value from the database"""
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(f"DELETE FROM value_manager WHERE value = ?", (value,))
+        db = self._connection
+        async with self._write_lock:
+            await db.execute(SQL_DELETE_VALUE, (value,))
             await db.commit()
 
         # Also remove from usage tracking
@@ -391,14 +660,11 @@ class BaseValueManager(ABC):
         if not values:
             return
 
-        async with aiosqlite.connect(self._db_path) as db:
+        db = self._connection
+        async with self._write_lock:
             for i in range(0, len(values), batch_size):
                 batch = values[i : i + batch_size]
-                placeholders = ",".join(["?" for _ in batch])
-                await db.execute(
-                    f"DELETE FROM value_manager WHERE value IN ({placeholders})",
-                    batch,
-                )
+                await db.execute(SQL_DELETE_VALUES, (json.dumps(batch),))
             await db.commit()
 
         # Also remove from usage tracking
@@ -408,77 +674,148 @@ class BaseValueManager(ABC):
 
     async def get_stats(self) -> dict[str, Any]:
         """Get statistics with optimized query"""
-        async with aiosqlite.connect(self._db_path) as db:
-            # Одним запросом получаем все статистики
-            cursor = await db.execute(
-                f"""
-                SELECT 
-                    COUNT(*) as total_count,
-                    SUM(CASE WHEN status = '{ValueStatus.ACTIVE.value}' THEN 1 ELSE 0 END) as active_count,
-                    SUM(CASE WHEN status = '{ValueStatus.COOLING.value}' THEN 1 ELSE 0 END) as cooling_count
-                FROM value_manager
-                """
-            )
-
-            row = await cursor.fetchone()
-            total_count, active_count, cooling_count = row if row else (0, 0, 0)
+        db = self._connection
+        # Counting per status is answered from the status index
+        cursor = await db.execute(SQL_COUNT_BY_STATUS)
+        counts = dict(await cursor.fetchall())
 
         return {
-            "total_values": total_count or 0,
-            "active_values": active_count or 0,
-            "cooling_values": cooling_count or 0,
+            "total_values": sum(counts.values()),
+            "active_values": counts.get(_ACTIVE, 0),
+            "cooling_values": counts.get(_COOLING, 0),
             "limits_configured": len(self.limits),
         }
 
-    async def validate_values(self) -> None:
-        """Validate all stored values and remove invalid ones"""
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute(f"SELECT value FROM value_manager")
-            values = [row[0] for row in await cursor.fetchall()]
+    async def _iter_values(
+        self,
+        checked_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over stored values page by page without loading the whole table.
 
-        if not values:
-            logger.info("No values to validate")
+        Args:
+            checked_before: Only yield values never checked or last checked before this time
+            limit: Only yield this many values checked longest ago, requires checked_before
+        """
+        db = self._connection
+
+        if checked_before is not None and limit is not None:
+            # A slice is read at once, values checked while it is validated can't shift it
+            cursor = await db.execute(
+                SQL_SELECT_VALIDATION_SLICE, (checked_before, limit)
+            )
+            for _, value in await cursor.fetchall():
+                yield value
             return
 
-        logger.info(f"{self.__class__.__name__}: Validating {len(values)} values...")
+        last_id = 0
 
-        if self.batch_validation:
-            await self._validate_values_batch(values)
-        else:
-            await self._validate_values_sequential(values)
+        while True:
+            if checked_before is None:
+                cursor = await db.execute(SQL_ITER_VALUES, (last_id, self.batch_size))
+            else:
+                cursor = await db.execute(
+                    SQL_ITER_UNCHECKED_VALUES,
+                    (last_id, checked_before, self.batch_size),
+                )
+            rows = await cursor.fetchall()
+            if not rows:
+                return
 
-    async def _validate_values_batch(self, values: list[str]) -> None:
-        """Validate values in batches"""
-        for i in range(0, len(values), self.batch_size):
-            batch = values[i : i + self.batch_size]
+            for _, value in rows:
+                yield value
 
-            # Create validation tasks for the batch
-            tasks = [self.validate_value(value) for value in batch]
-            results = await asyncio.gather(*tasks)
+            last_id = rows[-1][0]
 
-            invalid_values = []
+    async def _mark_checked(self, values: list[str]) -> None:
+        """Record that the values passed validation just now"""
+        if not values:
+            return
 
-            # Process results
-            for value, result in zip(batch, results):
-                if isinstance(result, Exception) or not result:
+        checked_at = datetime.now()
+        db = self._connection
+        async with self._write_lock:
+            await db.executemany(
+                SQL_MARK_CHECKED, [(checked_at, value) for value in values]
+            )
+            await db.commit()
+
+    async def validate_values(
+        self, max_age: int | None = None, limit: int | None = None
+    ) -> None:
+        """
+        Validate stored values and remove invalid ones.
+
+        Values are streamed from the database into a bounded queue drained by
+        validation workers, so validation starts right away and memory stays
+        proportional to the batch size. Batch mode runs
+        `max_concurrent_validations` workers, sequential mode runs one.
+
+        Args:
+            max_age: Skip values that passed validation within this many seconds (None to validate all)
+            limit: Validate at most this many values, the ones checked longest ago (needs max_age)
+        """
+        checked_before = (
+            datetime.fromtimestamp(time.time() - max_age) if max_age else None
+        )
+        workers_count = self.max_concurrent_validations if self.batch_validation else 1
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=self.batch_size)
+        valid_values: list[str] = []
+        invalid_values: list[str] = []
+        values_count = 0
+        removed_count = 0
+
+        async def worker() -> None:
+            while (value := await queue.get()) is not None:
+                try:
+                    is_valid = await self.validate_value(value)
+                except Exception:
+                    is_valid = False
+
+                if is_valid:
+                    valid_values.append(value)
+                else:
                     invalid_values.append(value)
 
-            # Remove invalid values
-            if invalid_values:
-                await self.remove_values_batch(invalid_values)
+        async def flush() -> None:
+            nonlocal removed_count
+            checked, removed = valid_values.copy(), invalid_values.copy()
+            valid_values.clear()
+            invalid_values.clear()
 
-            logger.info(
-                f"Processed batch {i // self.batch_size + 1} of {len(values) // self.batch_size + 1}"
-            )
+            await self._mark_checked(checked)
+            await self.remove_values_batch(removed)
+            removed_count += len(removed)
 
-    async def _validate_values_sequential(self, values: list[str]) -> None:
-        """Validate values one by one"""
-        for value in values:
-            try:
-                if not await self.validate_value(value):
-                    await self.remove_value(value)
-            except Exception as e:
-                await self.remove_value(value)
+        logger.info(f"{self.__class__.__name__}: Validating values...")
+
+        workers = [asyncio.create_task(worker()) for _ in range(workers_count)]
+        try:
+            async for value in self._iter_values(checked_before, limit):
+                await queue.put(value)
+                values_count += 1
+
+                # Write results in chunks to share one transaction
+                if len(valid_values) + len(invalid_values) >= VALIDATION_FLUSH_SIZE:
+                    await flush()
+
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        if not values_count:
+            logger.info("No values to validate")
+            return
+
+        await flush()
+
+        logger.info(
+            f"{self.__class__.__name__}: Validated {values_count} values, removed {removed_count} invalid"
+        )
 
     async def fetch_and_store_values(self) -> None:
         """Fetch new values and store them"""
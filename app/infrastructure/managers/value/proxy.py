@@ -1,8 +1,10 @@
-from app.utils.async_http_client import AsyncHttpClient, ClientTimeout
+from app.utils.async_http_client import AsyncHttpClient, ClientTimeout, shared_connector
 from app.core import logger, settings
 from .base import BaseValueManager
 
+from aiohttp import ClientError
 import aiofiles
+import asyncio
 
 
 class ProxyManager(BaseValueManager, AsyncHttpClient):
@@ -24,7 +26,9 @@ class ProxyManager(BaseValueManager, AsyncHttpClient):
         fetch_interval: int = 2*60*60, # 2 hours
         batch_validation: bool = True,
         batch_size: int = 1000,
+        max_concurrent_validations: int = 500,
         validation_timeout: int = 4,
+        connect_timeout: float = 0.5,
         test_url: str = "http://example.com",
     ):
         """
@@ -35,7 +39,9 @@ class ProxyManager(BaseValueManager, AsyncHttpClient):
             fetch_interval: How often to fetch new proxies (seconds)
             batch_validation: Whether to validate proxies in batches
             batch_size: Size of validation batches
+            max_concurrent_validations: How many proxies are validated at once
             validation_timeout: Timeout for proxy validation requests
+            connect_timeout: Timeout for establishing the connection to a proxy
             test_url: URL to use for proxy validation
         """
         BaseValueManager.__init__(
@@ -44,14 +50,23 @@ class ProxyManager(BaseValueManager, AsyncHttpClient):
             fetch_interval=fetch_interval,
             batch_validation=batch_validation,
             batch_size=batch_size,
+            max_concurrent_validations=max_concurrent_validations,
         )
         AsyncHttpClient.__init__(
             self,
             timeout=validation_timeout,
-            disable_ssl=True,
+            # Shared with the parsers, so tunnels opened during validation are reused
+            connector=shared_connector,
         )
 
         self._test_url = test_url
+        # Dead proxies usually fail to accept the connection, so they are dropped
+        # after connect_timeout instead of waiting for the whole request timeout
+        self._validation_timeout = ClientTimeout(
+            total=validation_timeout,
+            sock_connect=connect_timeout,
+            sock_read=validation_timeout,
+        )
 
         self._proxies_file = settings.CORE_PATH / "proxies.txt"
 
@@ -67,17 +82,15 @@ class ProxyManager(BaseValueManager, AsyncHttpClient):
         Returns:
             List of proxy strings in format "ip:port"
         """
-        proxies = []
+        # Insertion ordered, so proxies listed first are also tried first
+        proxies: dict[str, None] = {}
 
         try:
-            proxies.extend(await self._fetch_from_file())
-            # Remove duplicates
-            proxies = list(set(proxies))
-
-        except Exception as e:
-            logger.error(f"Error fetching proxies: {e}")
+            proxies.update(await self._fetch_from_file())
+        except Exception:
+            logger.exception("Error fetching proxies")
 
-        return proxies
+        return list(proxies)
 
     async def validate_value(self, value: str) -> bool:
         """
@@ -90,36 +103,36 @@ class ProxyManager(BaseValueManager, AsyncHttpClient):
             True if proxy is working, False otherwise
         """
         try:
-            response = await self.get(
+            # HEAD transfers no body. Only a success or redirect from the test URL counts,
+            # errors like 403 or 407 usually come from a dead or auth-walled proxy itself
+            async with self.http_client.head(
                 self._test_url,
                 proxy=value,
-                response_type="text",
-            )
-            return True if response else False
-        except Exception as e:
+                timeout=self._validation_timeout,
+                allow_redirects=False,
+            ) as response:
+                return 200 <= response.status < 400
+        except (ClientError, asyncio.TimeoutError, OSError, ValueError):
             return False
 
     async def cleanup(self):
-        await self.http_client.close()
+        await self.close()
         return await super().cleanup()
 
-    async def _fetch_from_file(self) -> list[str]:
+    async def _fetch_from_file(self) -> dict[str, None]:
         if not self._proxies_file.exists():
             async with aiofiles.open(self._proxies_file, "w") as f:
                 await f.write(
                     "# Add your proxies here in the format http://ip:port OR http://username:password@ip:port\n" \
                     "# ONLY HTTP PROXIES ARE SUPPORTED",
                 )
-            return []
+            return {}
 
+        proxies: dict[str, None] = {}
         async with aiofiles.open(self._proxies_file, mode="r") as f:
-            content = await f.read()
-
-        proxies = []
-        for line in content.splitlines():
-            if ":" not in line:
-                continue
-            if line.startswith("http://"):
-                proxies.append(line.strip())
+            async for line in f:
+                line = line.strip()
+                if ":" in line and line.startswith("http://"):
+                    proxies[line] = None
 
         return proxies
@@ -1 +1 @@
-from .media import MediaManger
+from .media import MediaManager, MediaManger, close_image_pool
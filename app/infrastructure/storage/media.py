@@ -1,33 +1,379 @@
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from functools import lru_cache
 from fastapi import UploadFile
-from typing import Literal
+from typing import AsyncIterator, Callable, Literal
+from aiohttp import ClientError, TCPConnector
 from pathlib import Path
 from uuid import uuid4
-from PIL import Image
+from PIL import Image, ImageFile
 import aiofiles
 import asyncio
 import hashlib
+import multiprocessing
+import os
+import warnings
 
 # import base64
 import io
 
+try:
+    import pyvips
+except ImportError:  # Optional, requires the libvips system library
+    pyvips = None
+
 from app.core import settings, logger
 from app.utils import AsyncHttpClient
 
+# Errors expected from decoding, encoding and writing a broken or unsupported image.
+# UnidentifiedImageError is an OSError, a dead pool worker surfaces as BrokenExecutor
+_IMAGE_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    ValueError,
+    Image.DecompressionBombError,
+    Image.DecompressionBombWarning,
+    BrokenExecutor,
+)
+if pyvips is not None:
+    _IMAGE_ERRORS += (pyvips.Error,)
+
+# Covers are far below this, larger images are refused by cover workers before they're decoded
+COVER_MAX_PIXELS = 50_000_000
+
+# WebP (quality, method) used when no per-size parameters are given
+DEFAULT_WEBP_PARAMS = (95, 6)
+
+# Covers of one batch that are downloaded and processed at the same time
+MAX_CONCURRENT_COVERS = 8
+
+_image_pool: ProcessPoolExecutor | None = None
+
+# Names of saved covers per covers directory, shared by all media managers of the process
+_existing_covers: dict[str, set[str]] = {}
+_existing_covers_lock = asyncio.Lock()
+
+
+def _get_image_pool() -> ProcessPoolExecutor:
+    """Get the process pool for image processing, created on first use"""
+    global _image_pool
+    if _image_pool is None:
+        # The server process already runs threads (aiosqlite, log sinks, executors),
+        # forking it could copy a lock held by one of them into the workers
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        _image_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_image_worker,
+        )
+    return _image_pool
+
+
+def _init_image_worker() -> None:
+    """Configure Pillow for covers in a pool worker, other Pillow users of the server process keep the defaults"""
+    # Some covers are served cut short, decode what's there instead of failing the cover
+    ImageFile.LOAD_TRUNCATED_IMAGES = True
+    # Pillow only warns above MAX_IMAGE_PIXELS and raises above twice that,
+    # the warning is raised instead so the limit is a hard cap
+    Image.MAX_IMAGE_PIXELS = COVER_MAX_PIXELS
+    warnings.simplefilter("error", Image.DecompressionBombWarning)
+
+
+async def close_image_pool() -> None:
+    """
+    Shut down the image process pool, waiting for running jobs.
+
+    The pool is shared by all media managers, so it has to be closed explicitly
+    once they are done.
+    """
+    global _image_pool
+    if _image_pool is not None:
+        pool, _image_pool = _image_pool, None
+        # Waiting for running jobs blocks, keep the event loop responsive meanwhile
+        await asyncio.to_thread(pool.shutdown)
+
+
+@lru_cache(maxsize=100_000)
+def _generate_filename(provider: str, content_id: str, size: str) -> str:
+    """Cached implementation of `MediaManager.generate_filename`, names never change"""
+    raw_name = f"{provider}_{content_id}_{size}".strip("_")
+    encoded = hashlib.sha1(raw_name.encode()).hexdigest()[:12]
+    return f"{encoded}.webp"
+
+
+@lru_cache(maxsize=100_000)
+def _cover_public_url(provider: str, content_id: str, size: str) -> str:
+    """Public URL of a cover file, cached together with its name"""
+    return f"{settings.COVER_PUBLIC_PATH}/{_generate_filename(provider, content_id, size)}"
+
+
+@lru_cache(maxsize=100_000)
+def _cover_public_urls(
+    provider: str,
+    content_id: str,
+    sizes: tuple[str, ...],
+) -> tuple[str, ...]:
+    """Public URLs of all sizes of a cover, for covers that are already saved"""
+    return tuple(_cover_public_url(provider, content_id, size) for size in sizes)
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(filepath: str, data: bytes) -> None:
+    """
+    Write data to a file, blocking.
+
+    Data goes to a temporary file that replaces the target once fully written,
+    so an interrupted write never leaves a truncated file under the final name.
+    """
+    tmp_path = f"{filepath}.{uuid4().hex[:8]}.tmp"
+    try:
+        # Unbuffered, covers are written with a single write call in practice
+        fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _process_image_worker(
+    image_data: bytes,
+    sizes: list[tuple[int, int] | None],
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    webp_params: list[tuple[int, int]] | None = None,
+) -> list[bytes]:
+    """
+    Convert image to WebP format, once for every requested size.
+
+    Uses libvips when pyvips is installed and Pillow otherwise.
+    Runs in the image process pool, so it has to stay a picklable module-level function.
+
+    Args:
+        image_data (bytes): Bytes of the original image
+        sizes (list[tuple[int, int] | None]): Target sizes as (width, height) tuples, None keeps the size
+        resample (Image.Resampling): Resampling filter of the Pillow implementation
+        webp_params (list[tuple[int, int]] | None): WebP (quality, method) for every size,
+            DEFAULT_WEBP_PARAMS for all sizes if None
+
+    :return: Processed image data in WebP format as bytes, in the order of sizes
+    """
+    if webp_params is None:
+        webp_params = [DEFAULT_WEBP_PARAMS] * len(sizes)
+
+    # Covers that are already WebP of the right size don't need decoding at all
+    webp_size = _get_webp_size(image_data)
+    if webp_size and all(size is None or size == webp_size for size in sizes):
+        return [image_data] * len(sizes)
+
+    if pyvips is not None:
+        return _process_image_vips(image_data, sizes, webp_params, webp_size)
+    return _process_image_pillow(image_data, sizes, resample, webp_params, webp_size)
+
+
+def _get_webp_size(image_data: bytes) -> tuple[int, int] | None:
+    """
+    Read the dimensions of a WebP image from its header, without decoding it.
+
+    :return: (width, height) tuple, or None if the data isn't a WebP image
+    """
+    if len(image_data) < 30 or image_data[:4] != b"RIFF" or image_data[8:12] != b"WEBP":
+        return None
+
+    chunk = image_data[12:16]
+    if chunk == b"VP8 " and image_data[23:26] == b"\x9d\x01\x2a":
+        # Lossy: 14-bit dimensions after the frame start code
+        width = int.from_bytes(image_data[26:28], "little") & 0x3FFF
+        height = int.from_bytes(image_data[28:30], "little") & 0x3FFF
+        return width, height
+    if chunk == b"VP8L" and image_data[20] == 0x2F:
+        # Lossless: 14-bit dimensions minus one, packed after the signature
+        bits = int.from_bytes(image_data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        # Extended: 24-bit canvas dimensions minus one
+        width = int.from_bytes(image_data[24:27], "little") + 1
+        height = int.from_bytes(image_data[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def _process_image_vips(
+    image_data: bytes,
+    sizes: list[tuple[int, int] | None],
+    webp_params: list[tuple[int, int]],
+    webp_size: tuple[int, int] | None = None,
+) -> list[bytes]:
+    """
+    libvips implementation of `_process_image_worker`.
+
+    The source is decoded once, shrunk while decoding to the largest requested size,
+    and the smaller sizes are resized from that image in memory.
+    Sizes equal to webp_size, the size of a WebP source, reuse the source bytes.
+    """
+    encoded_sizes = [size for size in sizes if not (webp_size and webp_size == size)]
+    if not encoded_sizes:
+        return [image_data for _ in sizes]
+
+    if None in encoded_sizes:
+        base = pyvips.Image.new_from_buffer(image_data, "", access="sequential")
+    else:
+        base = pyvips.Image.thumbnail_buffer(
+            image_data,
+            max(size[0] for size in encoded_sizes),  # type: ignore
+            height=max(size[1] for size in encoded_sizes),  # type: ignore
+            size="down",
+        )
+
+    # Drop alpha like the Pillow path does
+    if base.bands == 4:
+        base = base.extract_band(0, n=3)
+    # Render once, every size below reads these pixels instead of decoding again
+    base = base.copy_memory()
+
+    result = []
+    for target_size, (quality, method) in zip(sizes, webp_params):
+        if webp_size and webp_size == target_size:
+            result.append(image_data)
+            continue
+
+        if target_size:
+            image = base.thumbnail_image(
+                target_size[0],
+                height=target_size[1],
+                size="down",
+            )
+        else:
+            image = base
+
+        result.append(image.webpsave_buffer(Q=quality, effort=method, strip=True))
+
+    return result
+
+
+def _fit_size(
+    size: tuple[int, int],
+    target_size: tuple[int, int],
+) -> tuple[int, int] | None:
+    """
+    Get the largest size with the aspect ratio of size that fits into target_size.
 
-class MediaManger(AsyncHttpClient):
+    :return: (width, height) tuple, or None if size already fits, images are never enlarged
+    """
+    scale = min(target_size[0] / size[0], target_size[1] / size[1])
+    if scale >= 1:
+        return None
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def _process_image_pillow(
+    image_data: bytes,
+    sizes: list[tuple[int, int] | None],
+    resample: Image.Resampling,
+    webp_params: list[tuple[int, int]],
+    webp_size: tuple[int, int] | None = None,
+) -> list[bytes]:
+    """
+    Pillow implementation of `_process_image_worker`.
+
+    The source is decoded a single time and every size variant is produced from it.
+    Sizes equal to webp_size, the size of a WebP source, reuse the source bytes.
+    """
+    result = []
+    with io.BytesIO(image_data) as input_buffer, Image.open(input_buffer) as img:
+        # Every output fits into twice the largest size, the margin matches the
+        # reducing_gap of the final resize, so the output stays as sharp
+        working_size = None
+        if sizes and None not in sizes:
+            working_size = (
+                max(size[0] for size in sizes) * 2,  # type: ignore
+                max(size[1] for size in sizes) * 2,  # type: ignore
+            )
+
+        # JPEG can be scaled down while decoding
+        if img.format == "JPEG" and working_size:
+            img.draft(None, working_size)
+
+        source = img
+        try:
+            # Other formats are decoded in full, bring them down to the working size
+            # once with a cheap box filter instead of in every resize
+            fit_size = _fit_size(img.size, working_size) if working_size else None
+            if fit_size:
+                source = img.resize(fit_size, Image.Resampling.BOX)
+
+            if source.mode == "RGBA":
+                converted = source.convert("RGB")
+                if source is not img:
+                    source.close()
+                source = converted
+
+            for target_size, (quality, method) in zip(sizes, webp_params):
+                if webp_size and webp_size == target_size:
+                    result.append(image_data)
+                    continue
+
+                # resize returns a new image, so the source is shared by all sizes
+                fit_size = _fit_size(source.size, target_size) if target_size else None
+                resized = (
+                    source.resize(fit_size, resample, reducing_gap=2.0)
+                    if fit_size
+                    else source
+                )
+
+                with io.BytesIO() as output_buffer:
+                    resized.save(
+                        output_buffer,
+                        format="WEBP",
+                        lossless=False,
+                        quality=quality,
+                        method=method,
+                    )
+                    result.append(output_buffer.getvalue())
+
+                # Pool processes are long-lived, release pixel buffers as soon as they're encoded
+                if resized is not source:
+                    resized.close()
+        finally:
+            if source is not img:
+                source.close()
+
+    return result
+
+
+class MediaManager(AsyncHttpClient):
     """
     Manages image downloads, processing, and storage.
 
     Attributes:
         storage_path (Path): Directory where cover images are stored
         _client (AsyncClient): HTTP client for downloading images
+        RESAMPLE_FILTER (Image.Resampling): Filter used to resize images with Pillow,
+            BICUBIC or BILINEAR trade some sharpness for speed
     """
 
+    SIZE_MAP = {"": (225, 319), "s": (112, 160), "l": (423, 600)}
+    SIZE_NAMES = tuple(SIZE_MAP)
+    # WebP (quality, method) per cover size, method is the encoder effort from 0 to 6.
+    # Small covers can't show the difference of a high quality or a slow method
+    WEBP_PARAMS = {"": (85, 4), "s": (75, 0), "l": (90, 4)}
+    RESAMPLE_FILTER = Image.Resampling.LANCZOS
+
     def __init__(
         self,
         storage_path: str = settings.MEDIA_STORAGE_PATH,
         proxy: str | None = None,
         timeout: int = 10,
+        connector: TCPConnector | Callable[[], TCPConnector] | None = None,
     ) -> None:
         """
         Initialize the CoverManager.
@@ -36,17 +382,20 @@ class MediaManger(AsyncHttpClient):
             storage_path (str): Directory path where cover images will be stored
             proxy (str | None): Optional proxy URL for HTTP requests
             timeout (int): Request timeout in seconds
+            connector (TCPConnector | Callable[[], TCPConnector] | None): Externally owned connector,
+                or a factory returning one, to share a connection pool with other clients
         """
 
         self.storage_path = Path(storage_path)
         self.covers_path = self.storage_path / "covers"
+        # Cover paths are built on every save, plain string concatenation is cheaper than Path
+        self._covers_dir = f"{self.covers_path}{os.sep}"
         self.avatars_path = self.storage_path / "avatars"
 
-        self.SIZE_MAP = {"": (225, 319), "s": (112, 160), "l": (423, 600)}
 
-        super().__init__(proxy=proxy, timeout=timeout)
+        super().__init__(proxy=proxy, timeout=timeout, connector=connector)
 
-    async def __aenter__(self) -> "MediaManger":
+    async def __aenter__(self) -> "MediaManager":
         await super().__aenter__()
         return self
 
@@ -66,9 +415,7 @@ class MediaManger(AsyncHttpClient):
 
         :return: Generated filename in sha1 format with .webp extension
         """
-        raw_name = f"{provider}_{content_id}_{size}".strip("_")
-        encoded = hashlib.sha1(raw_name.encode()).hexdigest()[:12]
-        return f"{encoded}.webp"
+        return _generate_filename(provider, content_id, size)
 
         # encoded = base64.b32encode(raw_name.encode()).decode().lower()
         # return encoded.rstrip("=") + ".webp"
@@ -93,46 +440,40 @@ class MediaManger(AsyncHttpClient):
                 response_type="bytes",
                 proxy=proxy,
             )
-        except Exception as e:
-            logger.error(f"Error downloading image from {url}: {e}")
+        except (ClientError, asyncio.TimeoutError) as e:
+            # Dead links and rate limits are routine for covers
+            logger.warning(f"Error downloading image from {url}: {e}")
 
-    def _process_image(
+    async def _process_image(
         self,
         image_data: bytes,
-        target_size: tuple[int, int] | None = None,
-    ) -> bytes:
+        *sizes: tuple[int, int] | None,
+        webp_params: list[tuple[int, int]] | None = None,
+    ) -> list[bytes]:
         """
-        Convert image to WebP format and optionally resize it.
+        Convert image to WebP format and optionally resize it to each of the sizes.
+
+        Decoding, resizing and encoding are CPU-bound, so they run in a process pool
+        to keep the event loop free for downloads.
 
         Args:
             image_data (bytes): Bytes of the original image
-            target_size (tuple[int, int]): Optional target size as (width, height) tuple
+            *sizes (tuple[int, int] | None): Target sizes as (width, height) tuples, None keeps the size
+            webp_params (list[tuple[int, int]] | None): WebP (quality, method) for every size,
+                DEFAULT_WEBP_PARAMS for all sizes if None
 
-        :return: Processed image data in WebP format as bytes
+        :return: Processed image data in WebP format as bytes, in the order of sizes
         """
-        with (
-            io.BytesIO(image_data) as input_buffer,
-            Image.open(input_buffer) as img,
-            io.BytesIO() as output_buffer,
-        ):
-            if img.size == target_size:
-                return image_data
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_image_pool(),
+            _process_image_worker,
+            image_data,
+            list(sizes),
+            self.RESAMPLE_FILTER,
+            webp_params,
+        )
 
-            if img.mode == "RGBA":
-                img = img.convert("RGB")
-
-            if target_size:
-                img.thumbnail(target_size, Image.Resampling.LANCZOS)
-
-            img.save(
-                output_buffer,
-                format="WEBP",
-                quality=95,
-                method=6,
-            )
-
-            return output_buffer.getvalue()
-        
     def delete_file(self, file_path: str) -> None:
         """
         Delete a file from the storage (if it exists).
@@ -144,6 +485,7 @@ class MediaManger(AsyncHttpClient):
         if path.exists():
             try:
                 path.unlink()
+                _existing_covers.get(self._covers_dir, set()).discard(path.name)
             except Exception as e:
                 logger.error(f"Failed to delete file {file_path}: {e}")
 
@@ -174,41 +516,103 @@ class MediaManger(AsyncHttpClient):
         if image_url.endswith("apple-touch-icon-256.png"):
             return [settings.COVER_404_PATH] * 3
 
+        existing = await self._get_existing_covers()
         filename = self.generate_filename(provider, content_id, "l")
-        filepath = self.covers_path / filename
-        if filepath.exists() and not force_redownload:
-            return [
-                f"{settings.COVER_PUBLIC_PATH}/{self.generate_filename(provider, content_id, size_name)}"  # type: ignore
-                for size_name in self.SIZE_MAP.keys()
-            ]
+        if filename in existing and not force_redownload:
+            return list(_cover_public_urls(provider, content_id, self.SIZE_NAMES))
 
         image_data = await self._download_image(image_url, proxy=proxy)
         if not image_data:
             return [settings.COVER_404_PATH] * 3
 
-        result = []
-        for size_name, size in self.SIZE_MAP.items():
-            filename = self.generate_filename(provider, content_id, size_name)  # type: ignore
-            filepath = self.covers_path / filename
-
-            if filepath.exists() and not force_redownload:
-                result.append(f"{settings.COVER_PUBLIC_PATH}/{filename}")
-                continue
+        filenames = {
+            size_name: self.generate_filename(provider, content_id, size_name)  # type: ignore
+            for size_name in self.SIZE_MAP.keys()
+        }
+        missing = [
+            size_name
+            for size_name, filename in filenames.items()
+            if force_redownload or filename not in existing
+        ]
 
+        saved = dict.fromkeys(self.SIZE_MAP.keys(), True)
+        if missing:
+            # All missing sizes are produced from one decode of the source image
             try:
-                processed_data = self._process_image(image_data, size)
+                processed = await self._process_image(
+                    image_data,
+                    *(self.SIZE_MAP[size_name] for size_name in missing),
+                    webp_params=[self.WEBP_PARAMS[size_name] for size_name in missing],
+                )
+                results = await self._write_files(
+                    [
+                        (self._covers_dir + filenames[size_name], data)
+                        for size_name, data in zip(missing, processed)
+                    ]
+                )
+                saved.update(zip(missing, results))
+                existing.update(
+                    filenames[size_name]
+                    for size_name, ok in zip(missing, results)
+                    if ok
+                )
+            except _IMAGE_ERRORS as e:
+                logger.warning(f"Failed to process cover {image_url}: {str(e)}")
+                saved.update(dict.fromkeys(missing, False))
+
+        return [
+            (
+                _cover_public_url(provider, content_id, size_name)
+                if saved[size_name]
+                else settings.COVER_404_PATH
+            )
+            for size_name in self.SIZE_MAP.keys()
+        ]
 
-                async with aiofiles.open(filepath, "wb") as f:
-                    await f.write(processed_data)
+    async def _get_existing_covers(self) -> set[str]:
+        """
+        Get names of the cover files in storage, listed once per process on first use.
 
-                result.append(f"{settings.COVER_PUBLIC_PATH}/{filename}")
-            except Exception as e:
-                logger.error(f"Failed to process cover size {size}: {str(e)}")
-                if filepath.exists():
-                    filepath.unlink()
-                result.append(settings.COVER_404_PATH)
+        Lets save_cover skip covers that are already saved without a stat call per file.
+        Files removed from outside the managers are not noticed until restart.
+        """
+        existing = _existing_covers.get(self._covers_dir)
+        if existing is None:
+            # Concurrent first saves wait for a single listing instead of each scanning
+            async with _existing_covers_lock:
+                existing = _existing_covers.get(self._covers_dir)
+                if existing is None:
+                    existing = await asyncio.to_thread(
+                        lambda: {entry.name for entry in os.scandir(self.covers_path)}
+                    )
+                    _existing_covers[self._covers_dir] = existing
+        return existing
+
+    async def _write_files(self, files: list[tuple[str, bytes]]) -> list[bool]:
+        """
+        Write data to files atomically.
+
+        All files are written in one thread hop, aiofiles would take one for each
+        of open, write and close of every file.
 
-        return result
+        Args:
+            files (list[tuple[str, bytes]]): List of tuples (filepath, data)
+
+        :return: Whether each file was saved, in the order of files
+        """
+
+        def write_all() -> list[bool]:
+            results = []
+            for filepath, data in files:
+                try:
+                    _write_bytes(filepath, data)
+                    results.append(True)
+                except Exception as e:
+                    logger.error(f"Failed to write file {filepath}: {str(e)}")
+                    results.append(False)
+            return results
+
+        return await asyncio.to_thread(write_all)
 
     async def save_avatar(self, avatar: UploadFile) -> str | None:
         """
@@ -225,7 +629,7 @@ class MediaManger(AsyncHttpClient):
 
         avatar_bytes = await avatar.read()
 
-        processed_data = self._process_image(avatar_bytes, (200, 200))
+        processed_data, = await self._process_image(avatar_bytes, (200, 200))
         async with aiofiles.open(file_path, "wb") as f:
             await f.write(processed_data)
 
@@ -236,6 +640,7 @@ class MediaManger(AsyncHttpClient):
         images: list[tuple[str | None, str, str]],
         force_redownload: bool = False,
         proxy: str | None = None,
+        max_concurrent: int = MAX_CONCURRENT_COVERS,
     ) -> list[list[str]]:
         """
         Batch process and save multiple cover images.
@@ -244,11 +649,64 @@ class MediaManger(AsyncHttpClient):
             images: List of tuples (image_url, provider, content_id)
             force_redownload (bool): Whether to overwrite existing files
             proxy (str | None): Optional proxy URL for HTTP requests
+            max_concurrent (int): Maximum number of covers downloaded and processed at once
 
-        :return: List of lists containing public URLs for each image in all three sizes
+        :return: List of lists containing public URLs for each image in all three sizes,
+            in the order of images
         """
+        results: list[list[str]] = [[]] * len(images)
+        async for index, urls in self.batch_covers_save_iter(
+            images, force_redownload, proxy, max_concurrent
+        ):
+            results[index] = urls
+        return results
+
+    async def batch_covers_save_iter(
+        self,
+        images: list[tuple[str | None, str, str]],
+        force_redownload: bool = False,
+        proxy: str | None = None,
+        max_concurrent: int = MAX_CONCURRENT_COVERS,
+    ) -> AsyncIterator[tuple[int, list[str]]]:
+        """
+        Batch process and save multiple cover images, yielding each as soon as it's saved.
+
+        At most max_concurrent covers are in flight, so only that many downloaded
+        and processed images are held in memory at once.
+
+        Args:
+            images: List of tuples (image_url, provider, content_id)
+            force_redownload (bool): Whether to overwrite existing files
+            proxy (str | None): Optional proxy URL for HTTP requests
+            max_concurrent (int): Maximum number of covers downloaded and processed at once
+
+        :return: Async iterator of (index in images, public URLs in all three sizes),
+            in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def save(index: int, image_url: str | None, provider: str, content_id: str) -> tuple[int, list[str]]:
+            async with semaphore:
+                try:
+                    return index, await self.save_cover(
+                        image_url, provider, content_id, force_redownload, proxy
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to save cover {image_url}: {str(e)}")
+                    return index, [settings.COVER_404_PATH] * 3
+
         tasks = [
-            self.save_cover(image_url, provider, content_id, force_redownload, proxy)
-            for image_url, provider, content_id in images
+            asyncio.ensure_future(save(index, *image))
+            for index, image in enumerate(images)
         ]
-        return await asyncio.gather(*tasks)
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # Don't leave saves running if the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+
+# Kept for code written against the old misspelled name
+MediaManger = MediaManager
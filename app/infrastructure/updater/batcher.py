@@ -0,0 +1,161 @@
+from typing import Any, Awaitable, Callable
+import asyncio
+
+from app.infrastructure.db.models import Title
+from app.infrastructure.db.crud import TitleCRUD
+from app.core import logger
+
+# Rows written by one statement at most
+BATCH_MAX_SIZE = 32
+# How long the first row of a batch waits for others, in seconds
+BATCH_MAX_WAIT = 0.05
+
+
+class WriteBatcher:
+    """
+    Coalesces database writes of all workers into bulk statements.
+
+    Rows submitted within `max_wait` seconds of each other are written together,
+    up to `max_batch` at a time, so concurrent workers share database round-trips.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[Any]], Awaitable[bool]],
+        max_batch: int = BATCH_MAX_SIZE,
+        max_wait: float = BATCH_MAX_WAIT,
+    ) -> None:
+        """
+        Args:
+            write: Writes a list of rows with one statement, returns whether it succeeded
+            max_batch: Rows written by one statement at most
+            max_wait: How long the first row of a batch waits for others, in seconds
+        """
+        self._write = write
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        # None is queued by close to stop the batching loop after the rows before it
+        self._queue: asyncio.Queue[tuple[Any, asyncio.Future[bool]] | None] = (
+            asyncio.Queue()
+        )
+        # Set once enough rows are queued to fill a batch without waiting
+        self._batch_full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, row: Any) -> bool:
+        """
+        Write a row as part of the next batch.
+
+        Returns:
+            bool: Whether the row was written successfully
+        """
+        # Started on first use, the batcher can be created outside an event loop
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((row, future))
+        # The batcher holds the first row of a batch while it waits for the rest
+        if self._queue.qsize() >= self._max_batch - 1:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self) -> None:
+        """Collect submitted rows into batches and write them."""
+        batch: list[tuple[Any, asyncio.Future[bool]]] = []
+        try:
+            while True:
+                item = await self._queue.get()
+                if item is None:
+                    return
+                batch = [item]
+
+                # Waiting on the event rather than the queue, so a timeout never loses a row
+                if self._queue.qsize() < self._max_batch - 1:
+                    try:
+                        await asyncio.wait_for(self._batch_full.wait(), self._max_wait)
+                    except asyncio.TimeoutError:
+                        pass
+
+                closing = False
+                while len(batch) < self._max_batch and not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is None:
+                        closing = True
+                        break
+                    batch.append(item)
+                if self._queue.qsize() < self._max_batch - 1:
+                    self._batch_full.clear()
+
+                await self._flush(batch)
+                batch = []
+                if closing:
+                    return
+        except asyncio.CancelledError:
+            # Rows already taken from the queue won't be written
+            for _, future in batch:
+                future.cancel()
+            raise
+
+    async def _write_rows(self, rows: list[Any]) -> bool:
+        """Write rows with one statement, an unexpected error counts as a failure."""
+        try:
+            return await self._write(rows)
+        except Exception as e:
+            logger.error(f"Failed to write batch of {len(rows)} rows: {e}")
+            return False
+
+    async def _flush(self, batch: list[tuple[Any, asyncio.Future[bool]]]) -> None:
+        """Write a batch with one statement and resolve its futures."""
+        rows = [row for row, _ in batch]
+        if await self._write_rows(rows):
+            results = [True] * len(rows)
+        elif len(rows) > 1:
+            # One bad row fails the whole statement, rows are retried one by one
+            # so only the bad one fails
+            results = [await self._write_rows([row]) for row in rows]
+        else:
+            results = [False]
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the batcher, the batch being written and rows still waiting are written first."""
+        if self._task is not None and not self._task.done():
+            self._queue.put_nowait(None)
+            # Don't keep a partial batch waiting for rows that won't come
+            self._batch_full.set()
+            await self._task
+        self._task = None
+
+        # Rows submitted after the batching loop stopped
+        pending = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                pending.append(item)
+        if pending:
+            await self._flush(pending)
+
+
+class TitleBatcher:
+    """Batches title creation and updates of all workers."""
+
+    def __init__(self) -> None:
+        self._creates = WriteBatcher(TitleCRUD.create.bulk_upsert)
+        self._updates = WriteBatcher(TitleCRUD.update.bulk_fields)
+
+    async def create(self, title: Title) -> bool:
+        """Insert or update a title as part of the next batch."""
+        return await self._creates.submit(title)
+
+    async def update(self, title_id: str, **fields) -> bool:
+        """Update fields of an existing title as part of the next batch."""
+        return await self._updates.submit({"id": title_id, **fields})
+
+    async def close(self) -> None:
+        """Write everything still waiting and stop batching."""
+        await self._creates.close()
+        await self._updates.close()
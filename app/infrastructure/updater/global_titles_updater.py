@@ -1,17 +1,32 @@
 import asyncio
+import random
 
 from app.infrastructure.db.crud import *
 from app.core import logger, settings
+from app.infrastructure.storage import MediaManager, close_image_pool
+from app.providers import MalProvider, RemangaProvider
+from app.utils import close_shared_connector
 from ..managers import *
 from .worker import *
+from .batcher import TitleBatcher
+
+# Upper bound for queued pages, loaders wait for workers once it is reached
+QUEUE_MAXSIZE = 10_000
 
 
 class GlobalTitlesUpdater:
     def __init__(self) -> None:
         self._proxy_manager = ProxyManager()
         self._task_manager = TaskManager()
+        self._title_batcher = TitleBatcher()
+
+        # Clients shared by all workers, so each keeps a single connection pool
+        self._remanga_client = RemangaProvider()
+        self._mal_client = MalProvider()
+        # Covers get their own pool, the shared one is for proxied requests and skips TLS verification
+        self._media_manager = MediaManager()
 
-        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
 
         # Workers
         self._workers: list[FullParserWorker] = []
@@ -19,7 +34,9 @@ class GlobalTitlesUpdater:
         # Tasks
         self._worker_scaler_task: asyncio.Task | None = None
         self._idle_task: asyncio.Task | None = None
-        self._worker_manager_task: asyncio.Task | None = None
+        self._worker_tasks: dict[FullParserWorker, asyncio.Task] = {}
+        # Retried pages waiting for room in a full queue, the loop only keeps weak references
+        self._requeue_tasks: set[asyncio.Task] = set()
 
         self._running = False
 
@@ -33,21 +50,32 @@ class GlobalTitlesUpdater:
         await self._proxy_manager.initialize()
         await self._task_manager.initialize()
 
-        # Fetch and validate values
+        # Fetch and validate values, proxies checked shortly before a restart are skipped
         await self._proxy_manager.fetch_and_store_values()
-        await self._proxy_manager.validate_values()
+        await self._proxy_manager.validate_values(
+            max_age=self._proxy_manager.validation_interval
+        )
 
         # Determine optimal number of workers
         num_workers = await self._calculate_optimal_workers()
 
         # Create workers
-        self._workers = [
-            FullParserWorker(i, self._proxy_manager, self._task_manager)
-            for i in range(num_workers)
-        ]
+        self._workers = [self._create_worker(i) for i in range(num_workers)]
 
         logger.info(f"{self.__class__.__name__} initialized successfully.")
 
+    def _create_worker(self, worker_id: int) -> FullParserWorker:
+        """Create a worker that uses the shared managers and clients."""
+        return FullParserWorker(
+            worker_id,
+            self._proxy_manager,
+            self._task_manager,
+            self._title_batcher,
+            self._remanga_client,
+            self._mal_client,
+            self._media_manager,
+        )
+
     async def _calculate_optimal_workers(self) -> int:
         """Calculate optimal number of workers based on available proxies."""
         proxy_stats = await self._proxy_manager.get_stats()
@@ -71,9 +99,8 @@ class GlobalTitlesUpdater:
             return
 
         optimal_workers = await self._calculate_optimal_workers()
-        current_active = len(
-            [w for w in self._workers if w.status != WorkerStatus.DISABLED]
-        )
+        # Every active worker has exactly one running task
+        current_active = len(self._worker_tasks)
 
         # Scale down workers
         if optimal_workers < current_active:
@@ -82,11 +109,13 @@ class GlobalTitlesUpdater:
             for worker in self._workers:
                 if stopped_count >= workers_to_stop:
                     break
+                # Only idle workers are stopped, their task is waiting for the queue
                 if worker.status == WorkerStatus.READY:
                     worker.status = WorkerStatus.DISABLED
+                    self._stop_worker(worker)
                     stopped_count += 1
                     logger.info(
-                        f"Worker {worker.id} temporarily disabled due to insufficient proxies"
+                        f"{worker.log_prefix} temporarily disabled due to insufficient proxies"
                     )
         # Scale up workers
         elif optimal_workers > current_active:
@@ -98,10 +127,11 @@ class GlobalTitlesUpdater:
                 if started_count >= workers_to_start:
                     break
 
-                if worker.status == WorkerStatus.DISABLED:
+                if worker not in self._worker_tasks:
                     worker.status = WorkerStatus.READY
+                    self._start_worker(worker)
                     started_count += 1
-                    logger.info(f"Worker {worker.id} reactivated")
+                    logger.info(f"{worker.log_prefix} reactivated")
 
             # If still need more workers, create new ones
             if (
@@ -115,11 +145,9 @@ class GlobalTitlesUpdater:
 
                 for _ in range(new_workers_needed):
                     worker_id = len(self._workers)
-                    self._workers.append(
-                        FullParserWorker(
-                            worker_id, self._proxy_manager, self._task_manager
-                        )
-                    )
+                    worker = self._create_worker(worker_id)
+                    self._workers.append(worker)
+                    self._start_worker(worker)
                     logger.info(f"Created new worker {worker_id}")
 
     async def _worker_scaler(self) -> None:
@@ -147,17 +175,9 @@ class GlobalTitlesUpdater:
             logger.warning(f"Could not determine total pages for {provider.name}")
             return
 
-        # Get completed pages within the time frame
-        completed_pages = set(
-            await self._task_manager.get_completed_pages(provider),
-        )
-
-        # Calculate pages that need to be parsed
-        all_pages = set(range(1, total_pages + 1))
-        pages_to_parse = list(all_pages - completed_pages)
-
-        # Add pages to queue
-        for page in pages_to_parse:
+        # Add pages not completed within the time frame to the queue,
+        # waiting for workers to make room when it is full
+        for page in await self._task_manager.get_missing_pages(provider, total_pages):
             await self._queue.put((provider, page))
 
     async def _get_total_pages(self, provider: SourceProvider) -> int | None:
@@ -166,9 +186,8 @@ class GlobalTitlesUpdater:
             proxy = await self._proxy_manager.get_value()
 
             if provider == SourceProvider.MAL:
-                async with MalProvider() as client:
-                    page_data = await client.get_page(page=1, proxy=proxy)
-                    return page_data.pagination.last_visible_page
+                page_data = await self._mal_client.get_page(page=1, proxy=proxy)
+                return page_data.pagination.last_visible_page
 
             elif provider == SourceProvider.REMANGA:
                 # TODO: Implement a method to determine the last page
@@ -181,30 +200,25 @@ class GlobalTitlesUpdater:
             logger.error(f"Failed to get total pages for {provider.name}: {e}")
             return None
 
-    async def _worker_manager(self) -> None:
-        """Manage workers and assign tasks from the queue."""
+    def _start_worker(self, worker: FullParserWorker) -> None:
+        """Start the task that feeds a worker from the queue."""
+        if worker not in self._worker_tasks:
+            self._worker_tasks[worker] = asyncio.create_task(self._run_worker(worker))
+
+    def _stop_worker(self, worker: FullParserWorker) -> None:
+        """Cancel the task of a worker, pages left in the queue go to other workers."""
+        task = self._worker_tasks.pop(worker, None)
+        if task:
+            task.cancel()
+
+    async def _run_worker(self, worker: FullParserWorker) -> None:
+        """Process pages from the queue with a worker, waiting for them while it's empty."""
         while self._running:
+            provider, page = await self._queue.get()
             try:
-                if self._queue.empty():
-                    await asyncio.sleep(10)
-                    continue
-
-                # Find available workers and assign tasks
-                for worker in self._workers:
-                    if worker.status == WorkerStatus.READY and not self._queue.empty():
-                        try:
-                            provider, page = await self._queue.get()
-                            asyncio.create_task(
-                                self._process_worker_task(worker, provider, page)
-                            )
-                        except asyncio.QueueEmpty:
-                            break
-
-                await asyncio.sleep(1)
-
+                await self._process_worker_task(worker, provider, page)
             except Exception as e:
-                logger.error(f"{self.__class__.__name__}: Error in worker manager: {e}")
-                await asyncio.sleep(1)
+                logger.error(f"{worker.log_prefix}: Unexpected error: {e}")
 
     async def _process_worker_task(
         self,
@@ -215,24 +229,41 @@ class GlobalTitlesUpdater:
         """Process a single worker task with error handling."""
         try:
             logger.info(
-                f"Worker {worker.id} processing page {page} for {provider.name}"
+                f"{worker.log_prefix} processing page {page} for {provider.name}"
             )
             await worker.process_page(provider, page)
         except WorkerError as e:
             # Return task to queue if it should be retried
             if e.should_retry:
-                await self._queue.put((provider, page))
+                self._requeue(provider, page)
                 logger.info(
-                    f"Worker {worker.id}: Page {page} returned to queue for retry"
+                    f"{worker.log_prefix}: Page {page} returned to queue for retry"
                 )
         finally:
             self._queue.task_done()
 
+    def _requeue(self, provider: SourceProvider, page: int) -> None:
+        """
+        Put a page back into the queue without blocking the worker.
+
+        Workers are the only consumers, so a worker waiting on a full queue could wait forever.
+        """
+        try:
+            self._queue.put_nowait((provider, page))
+        except asyncio.QueueFull:
+            task = asyncio.create_task(self._queue.put((provider, page)))
+            self._requeue_tasks.add(task)
+            task.add_done_callback(self._requeue_tasks.discard)
+
     async def _update_cycle(self) -> None:
         """Run an idle cycle that periodically updates the queues."""
-        while True:
+        while self._running:
             try:
-                await asyncio.sleep(settings.GTP_UPDATE_INTERVAL.total_seconds())
+                # Jitter keeps several updater instances from reloading in lockstep
+                await asyncio.sleep(
+                    settings.GTP_UPDATE_INTERVAL.total_seconds()
+                    * random.uniform(0.9, 1.1)
+                )
 
                 logger.info(f"{self.__class__.__name__}: Running update queue cycle...")
 
@@ -253,18 +284,22 @@ class GlobalTitlesUpdater:
 
         self._running = True
 
+        # Workers have to be running before the queue is loaded, otherwise
+        # the loader would wait forever on a full queue
+        for worker in self._workers:
+            if worker.status != WorkerStatus.DISABLED:
+                self._start_worker(worker)
+        self._worker_scaler_task = asyncio.create_task(self._worker_scaler())
+
         # Load initial parsing queues
         await self._load_parsing_queues()
 
         self._idle_task = asyncio.create_task(self._update_cycle())
-        self._worker_manager_task = asyncio.create_task(self._worker_manager())
-        self._worker_scaler_task = asyncio.create_task(self._worker_scaler())
         logger.info(f"{self.__class__.__name__}: parsing cycle started.")
 
         try:
             await asyncio.gather(
                 self._idle_task,
-                self._worker_manager_task,
                 self._worker_scaler_task,
             )
         except asyncio.CancelledError:
@@ -278,9 +313,12 @@ class GlobalTitlesUpdater:
 
         tasks_to_cancel = [
             self._idle_task,
-            self._worker_manager_task,
             self._worker_scaler_task,
+            *self._worker_tasks.values(),
+            *self._requeue_tasks,
         ]
+        self._worker_tasks.clear()
+        self._requeue_tasks.clear()
 
         for task in tasks_to_cancel:
             if task:
@@ -291,9 +329,14 @@ class GlobalTitlesUpdater:
                     pass
 
         await self._proxy_manager.cleanup()
+        await self._title_batcher.close()
 
-        for worker in self._workers:
-            await worker.cleanup()
+        await self._remanga_client.close()
+        await self._mal_client.close()
+        await self._media_manager.close()
+
+        await close_shared_connector()
+        await close_image_pool()
 
         logger.info(f"{self.__class__.__name__} stopped")
 
@@ -310,9 +353,9 @@ class GlobalTitlesUpdater:
     @staticmethod
     def _clear_queue(queue: asyncio.Queue) -> None:
         """Clear the specified queue."""
-        while not queue.empty():
+        while True:
             try:
                 queue.get_nowait()
-                queue.task_done()
-            except:
+            except asyncio.QueueEmpty:
                 break
+            queue.task_done()
@@ -1,14 +1,22 @@
+from aiohttp import ClientResponseError
 from enum import Enum, auto
-from tqdm import tqdm
 import asyncio
 
 # from app.domain.services.translation import Translator
-from app.infrastructure.storage import MediaManger
+from app.infrastructure.storage import MediaManager
 from app.infrastructure.db.models import *
 from app.infrastructure.managers import *
 from app.infrastructure.db.crud import *
+from app.infrastructure.db.session import POOL_SIZE
 from app.providers import *
 from app.core import logger
+from .batcher import TitleBatcher
+
+# Titles processed at the same time by all workers of the process. Bounded by the
+# pooled connections, the overflow is left for page lookups and batched writes.
+MAX_CONCURRENT_TITLES = POOL_SIZE
+
+_titles_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TITLES)
 
 
 class WorkerStatus(Enum):
@@ -51,18 +59,25 @@ class FullParserWorker:
         worker_id: int,
         proxy_manager: ProxyManager,
         page_tracker: TaskManager,
+        title_batcher: TitleBatcher,
+        remanga_client: RemangaProvider,
+        mal_client: MalProvider,
+        media_manager: MediaManager,
     ) -> None:
         self.id = worker_id
         self.status = WorkerStatus.READY
+        self.log_prefix = f"Worker {worker_id}"
 
-        # Initialize title providers
-        self._remanga_client = RemangaProvider()
-        self._mal_client = MalProvider()
+        # Title providers and the media manager are shared by all workers and owned by the updater
+        self._remanga_client = remanga_client
+        self._mal_client = mal_client
+        self._media_manager = media_manager
 
         # Initialize managers
         self._proxy_manager = proxy_manager
         self._task_manager = page_tracker
-        self._media_manager = MediaManger()
+        # Title writes of all workers are batched together
+        self._title_batcher = title_batcher
 
     async def process_page(self, provider: SourceProvider, page: int) -> None:
         """Process a single page from the specified provider."""
@@ -95,20 +110,62 @@ class FullParserWorker:
                     should_retry=False,
                 )
 
-            # Process each title on the page
-            for title in tqdm(page_data.data, desc=f"Page [{page}]"):
-                await self._process_title(title, proxy)
+            # Titles of the page already in the database are fetched with one query
+            existing_titles = {
+                title.id: title
+                for title in await TitleCRUD.read.by_ids(
+                    [title.id for title in page_data.data]
+                )
+            }
+
+            # Process titles of the page concurrently, new titles are created
+            # together so their covers are downloaded in one batch
+            async def process_title(title: Title) -> Title | None:
+                async with _titles_semaphore:
+                    return await self._process_title(
+                        title, existing_titles.get(title.id)
+                    )
+
+            tasks = [
+                asyncio.ensure_future(process_title(title))
+                for title in page_data.data
+            ]
+            try:
+                processed = await asyncio.gather(*tasks)
+            finally:
+                # Like a TaskGroup, titles still running don't outlive a failed page
+                for task in tasks:
+                    task.cancel()
+            new_titles = [title for title in processed if title]
+            logger.debug(
+                f"{self.log_prefix} processed {len(processed)} titles of page {page}, "
+                f"{len(new_titles)} new"
+            )
+
+            await self._create_new_titles(
+                new_titles,
+                # Remanga is sensitive to proxies, its covers are downloaded directly
+                proxy=proxy if provider != SourceProvider.REMANGA else None,
+            )
 
             # Mark page as completed
             await self._task_manager.mark_page_completed(provider, page)
 
             logger.success(
-                f"Worker {self.id} completed page {page} for {provider.name}"
+                f"{self.log_prefix} completed page {page} for {provider.name}"
             )
         except WorkerError:
             raise
+        except ClientResponseError as e:
+            # Rate limits and server errors are transient, a missing page is not
+            raise WorkerError(
+                page,
+                f"{provider.name} responded with {e.status} for page {page}",
+                status_code=e.status,
+                should_retry=e.status != 404,
+            )
         except Exception as e:
-            logger.error(f"Worker {self.id} failed to process page {page}: {e}")
+            logger.error(f"{self.log_prefix} failed to process page {page}: {e}")
             raise WorkerError(
                 page,
                 f"Failed to process page {page} from {provider.name}: {str(e)}",
@@ -117,17 +174,28 @@ class FullParserWorker:
         finally:
             self.status = WorkerStatus.READY
 
-    async def _process_title(self, title: Title, proxy: Optional[str]) -> None:
-        """Process a single title - either update existing or create new."""
-        # Check if title exists in database
-        existing_title: Title | None = await TitleCRUD.read.by_id(title.id)  # type: ignore
+    async def _process_title(
+        self, title: Title, existing_title: Title | None
+    ) -> Title | None:
+        """
+        Update an existing title or prepare a new one.
+
+        Args:
+            title (Title): Title parsed from the provider page
+            existing_title (Title | None): Stored title with the same ID, None if there is none
+
+        Returns:
+            Title to create if it doesn't exist in the database yet, None otherwise
+        """
+        new_title = None
 
         if existing_title:
             # Update existing title
             await self._update_existing_title(existing_title, title)
         else:
-            # Create new title with covers
+            # New title is created later together with the rest of the page
             logger.debug(f"Creating new title: {title.id}")
+            new_title = title
 
             # Get full title data for remanga if title don't exists
             if title.source_provider == SourceProvider.REMANGA:
@@ -136,19 +204,18 @@ class FullParserWorker:
                         title.source_id
                     )
                     if full_title_data:
-                        title = full_title_data
+                        new_title = full_title_data
                 except Exception as e:
                     logger.error(
                         f"Failed to fetch full title data for {title.source_id}: {e}"
                     )
-            await self._create_new_title(title, proxy)
 
-        await asyncio.sleep(0.1)  # Small delay to avoid overload
+        return new_title
 
     async def _update_existing_title(self, existing: Title, new: Title) -> None:
         """Update existing title while preserving important fields."""
-        result = await TitleCRUD.update.fields(
-            title_id=existing.id,
+        result = await self._title_batcher.update(
+            existing.id,
             name_ru=new.name_ru or existing.name_ru,
             name_en=new.name_en or existing.name_en,
             alt_names=new.alt_names,
@@ -173,34 +240,53 @@ class FullParserWorker:
                 f"Failed to update existing title {existing.id} in the database."
             )
 
-    async def _create_new_title(self, title: Title, proxy: Optional[str]) -> None:
-        """Create new title with downloaded covers."""
-        if title.cover and title.cover.url:
-            # Download and save covers
-            covers_data = await self._media_manager.save_cover(
-                image_url=title.cover.url,
-                provider=title.source_provider.name,
-                content_id=title.source_id,
-                proxy=(
-                    proxy if title.source_provider != SourceProvider.REMANGA else None
-                ),
-            )
+    async def _create_new_titles(self, titles: list[Title], proxy: Optional[str]) -> None:
+        """
+        Create new titles with covers downloaded in a single batch.
 
+        Each title is saved as soon as its cover is ready instead of waiting for the whole batch.
+        """
+        with_covers: list[Title] = []
+        without_covers: list[Title] = []
+        for title in titles:
+            if title.cover and title.cover.url:
+                with_covers.append(title)
+            else:
+                without_covers.append(title)
+
+        # Titles without covers have nothing to wait for, they are saved together
+        if without_covers and not await TitleCRUD.create.bulk_upsert(without_covers):
+            logger.error(f"Failed to create {len(without_covers)} titles.")
+
+        if not with_covers:
+            return
+
+        # Download and save covers
+        async for index, covers_data in self._media_manager.batch_covers_save_iter(
+            [
+                (title.cover.url, title.source_provider.name, title.source_id)
+                for title in with_covers
+            ],
+            proxy=proxy,
+        ):
+            if self._media_manager.http_client.closed:
+                logger.warning(
+                    "HTTP session is closed, skipping creation of remaining titles"
+                )
+                return
+
+            title = with_covers[index]
             if covers_data:
                 title.cover = TitleCover(
                     url=covers_data[0],
                     small_url=covers_data[1],
                     large_url=covers_data[2],
                 )
+            await self._create_title(title)
 
-            if self._media_manager.http_client.closed:
-                logger.warning(
-                    f"HTTP session is closed, skipping title creation for {title.id}"
-                )
-                return
-
-        # Save title to database
-        result = await TitleCRUD.create.upsert(title)
+    async def _create_title(self, title: Title) -> None:
+        """Save a new title to the database as part of the next batch."""
+        result = await self._title_batcher.create(title)
         if not result:
             logger.error(f"Failed to create title: {title.id}.")
 
@@ -255,11 +341,3 @@ class FullParserWorker:
     #             )
     #         if "title" in data and not title.name_en:
     #             title.name_en = data["title"]
-
-    async def cleanup(self) -> None:
-        """Cleanup resources used by the worker."""
-        # Close all http clients and managers
-        await self._remanga_client.close()
-        await self._mal_client.close()
-        await self._media_manager.close()
-        # await self._translator.close()
@@ -1,6 +1,7 @@
 from aiohttp.client_exceptions import ClientResponseError
-from aiohttp import ClientTimeout
+from aiohttp import ClientTimeout, TCPConnector
 from abc import ABC, abstractmethod
+from typing import Callable
 
 from app.infrastructure.db.models import Title
 from app.domain.models import TitlePagination
@@ -17,6 +18,7 @@ class BaseProvider(ABC, AsyncHttpClient):
         self,
         base_url: str | None = None,
         timeout: float = 15.0,
+        connector: TCPConnector | Callable[[], TCPConnector] | None = None,
     ):
         """
         Initialize the provider with any necessary arguments.
@@ -24,11 +26,13 @@ class BaseProvider(ABC, AsyncHttpClient):
         Args:
             base_url: Base URL for the API
             timeout: Timeout for requests in seconds
+            connector: Externally owned connector, or a factory returning one, to share with other clients
         """
         super().__init__(
             base_url=base_url,
             timeout=timeout,
             disable_ssl=True,
+            connector=connector,
         )
 
     @abstractmethod
@@ -1,6 +1,11 @@
 from ..base_provider import *
+from app.utils import shared_connector
 from .parser import MalParser
 from app.core import logger
+import time
+
+# How long fetched pages are reused, retried pages are usually requested again within minutes
+PAGE_CACHE_TTL = 5 * 60
 
 
 class MalProvider(BaseProvider):
@@ -9,9 +14,14 @@ class MalProvider(BaseProvider):
     This class is responsible for interacting with the MAL API to fetch data.
     """
 
+    # Shared by all instances, so a page retried by another worker is still a hit.
+    # Maps (page, limit) to (expiry time, raw response).
+    _page_cache: dict[tuple[int, int], tuple[float, dict]] = {}
+
     def __init__(self, base_url="https://api.jikan.moe/v4/"):
         """Initialize the MAL provider with the base URL."""
-        super().__init__(base_url=base_url)
+        # MAL is requested through proxies, share their connection pool
+        super().__init__(base_url=base_url, connector=shared_connector)
 
     async def __aenter__(self) -> "MalProvider":
         """Async context manager entry."""
@@ -60,20 +70,46 @@ class MalProvider(BaseProvider):
 
         Returns:
             TitlePagination: A pagination object containing the list of titles and pagination info.
+
+        Raises:
+            ClientResponseError: If the request fails with a client error.
         """
         if page < 1 or not (1 <= limit <= 25):
             raise ValueError("Page must be >= 1 and limit must be between 1 and 25.")
 
         try:
-            data = await self.get(
-                url=f"manga?page={page}&limit={limit}",
-                proxy=proxy,
-            )
+            data = self._get_cached_page(page, limit)
+            if data is None:
+                data = await self.get(
+                    url=f"manga?page={page}&limit={limit}",
+                    proxy=proxy,
+                )
 
-            if not data or "data" not in data:
-                return TitlePagination()
+                if not data or "data" not in data:
+                    return TitlePagination()
 
+                self._cache_page(page, limit, data)
+
+            # Raw responses are cached, so every call gets its own title objects
             return MalParser.parse_page(data)
+        except ClientResponseError:
+            raise # re-raise to handle it in the worker
         except Exception as e:
             logger.error(f"Error fetching page from MAL: {e}")
             return TitlePagination()
+
+    @classmethod
+    def _get_cached_page(cls, page: int, limit: int) -> dict | None:
+        """Get a raw page response fetched less than PAGE_CACHE_TTL seconds ago"""
+        cached = cls._page_cache.get((page, limit))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    @classmethod
+    def _cache_page(cls, page: int, limit: int, data: dict) -> None:
+        """Cache a raw page response, dropping expired ones"""
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in cls._page_cache.items() if expires_at <= now]:
+            del cls._page_cache[key]
+        cls._page_cache[(page, limit)] = (now + PAGE_CACHE_TTL, data)
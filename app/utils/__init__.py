@@ -1,3 +1,3 @@
-from .async_http_client import AsyncHttpClient
+from .async_http_client import AsyncHttpClient, shared_connector, close_shared_connector
 from .task_tracker import TaskTracker
 from .text import tag_remover
\ No newline at end of file
@@ -4,7 +4,7 @@ from aiohttp import (
     TCPConnector,
     ClientTimeout,
 )
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 import sys
 if sys.version_info >= (3, 11):
     from typing import Unpack
@@ -13,6 +13,43 @@ else:
 
 ResponseType = Literal["json", "text", "bytes", "stream"]
 
+_shared_connector: TCPConnector | None = None
+
+
+def shared_connector() -> TCPConnector:
+    """
+    Get the connector shared by clients that talk through proxies.
+
+    Sharing one pool lets keep-alive connections (including proxy tunnels) be
+    reused across clients instead of every client opening its own.
+    Must be called from a running event loop.
+
+    Returns:
+        TCPConnector: Process-wide connector instance.
+    """
+    global _shared_connector
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = TCPConnector(
+            ssl=False,
+            limit=0,
+            keepalive_timeout=120,
+        )
+    return _shared_connector
+
+
+async def close_shared_connector() -> None:
+    """
+    Close the shared connector.
+
+    Clients don't own the shared connector, so it has to be closed explicitly
+    once all of them are done.
+    """
+    global _shared_connector
+    if _shared_connector is not None:
+        await _shared_connector.close()
+        _shared_connector = None
+
+
 
 class AsyncHttpClient:
     """
@@ -22,7 +59,8 @@ class AsyncHttpClient:
     different response types and common HTTP methods.
     
     Attributes:
-        http_client (ClientSession): The underlying aiohttp ClientSession instance.
+        http_client (ClientSession): The underlying aiohttp ClientSession instance,
+            created on first use so the client can be constructed outside an event loop.
     """
     
     def __init__(
@@ -31,6 +69,7 @@ class AsyncHttpClient:
         timeout: float = 15.0,
         disable_ssl: bool = False,
         proxy: str | None = None,
+        connector: TCPConnector | Callable[[], TCPConnector] | None = None,
     ) -> None:
         """
         Initialize the AsyncHttpClient.
@@ -40,17 +79,38 @@ class AsyncHttpClient:
             timeout (float): Request timeout in seconds. Defaults to 15.0.
             disable_ssl (bool): Whether to disable SSL verification. Defaults to False.
             proxy (str | None): Proxy URL to use for requests. Defaults to None. (ONLY HTTP PROXIES)
+            connector (TCPConnector | Callable[[], TCPConnector] | None): Externally owned connector,
+                or a factory returning one, to use instead of creating one.
+                `disable_ssl` is ignored then. Defaults to None.
         """
-        self.http_client = ClientSession(
-            base_url=base_url,
-            timeout=ClientTimeout(total=timeout),
-            proxy=proxy,
-            connector=TCPConnector(
-                ssl=not disable_ssl,
-            ),
-        )
-        if disable_ssl:
-            self.http_client._ssl = False
+        self._base_url = base_url
+        self._timeout = ClientTimeout(total=timeout)
+        self._proxy = proxy
+        self._disable_ssl = disable_ssl
+        self._connector = connector
+        self._session: ClientSession | None = None
+
+    @property
+    def http_client(self) -> ClientSession:
+        """
+        Get the underlying session, creating it on first access.
+
+        aiohttp sessions and connectors have to be created inside a running event loop,
+        so this is deferred until the client is actually used.
+        """
+        if self._session is None:
+            connector = self._connector
+            if callable(connector):
+                connector = connector()
+
+            self._session = ClientSession(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                proxy=self._proxy,
+                connector=connector or TCPConnector(ssl=not self._disable_ssl),
+                connector_owner=connector is None,
+            )
+        return self._session
 
     async def request(
         self,
@@ -221,7 +281,8 @@ class AsyncHttpClient:
         This method should be called when you're done using the client
         to properly clean up connections and free resources.
         """
-        await self.http_client.close()
+        if self._session is not None:
+            await self._session.close()
 
     async def __aenter__(self) -> "AsyncHttpClient":
         """
@@ -6,6 +6,7 @@ from fastapi_cache import FastAPICache
 from fastapi import FastAPI, HTTPException
 import uvicorn
 
+from app.infrastructure.storage import close_image_pool
 from app.api import *
 from app.core import *
 
@@ -18,6 +19,7 @@ async def lifespan(_: FastAPI):
     yield
     # Cleanup resources when the app is shutting down
     await redis.aclose()
+    await close_image_pool()
 
 
 app = FastAPI(
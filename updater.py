@@ -2,6 +2,11 @@ from fastapi_cache.backends.redis import RedisBackend
 from fastapi_cache import FastAPICache
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from app.infrastructure.updater import GlobalTitlesUpdater
 from app.core import *
 
@@ -35,4 +40,9 @@ if __name__ == "__main__":
     setup_logging("updater")
 
     FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+
+    # libuv based loop, noticeably cheaper per socket event than the default one
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(main())